@@ -1,30 +1,97 @@
+import os
+from collections import OrderedDict
 import numpy as np
 from typing import List, Optional, Tuple
 import cv2 
 
+try:
+    from numba import njit, prange
+except ImportError:
+    # numba is optional, custom kernels fall back to cv2.filter2D without it
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _conv2d_nb(image: np.ndarray, kernel: np.ndarray, out: np.ndarray) -> None:
+        """
+        Correlates an image with a square kernel, one row per thread.
+
+        Pixels outside the image count as zero. The kernel loops are clamped to
+        the taps that land inside the image, so no padded copy is needed.
+        :param image: 2D uint8 image, H x W.
+        :param kernel: K x K float32 kernel.
+        :param out: H x W float32 output buffer.
+        """
+        height, width = out.shape
+        size = kernel.shape[0]
+        half = size // 2
+        for i in prange(height):
+            ki_start = max(0, half - i)
+            ki_end = min(size, height + half - i)
+            for j in range(width):
+                kj_start = max(0, half - j)
+                kj_end = min(size, width + half - j)
+                acc = 0.0
+                for ki in range(ki_start, ki_end):
+                    for kj in range(kj_start, kj_end):
+                        acc += image[i + ki - half, j + kj - half] * kernel[ki, kj]
+                out[i, j] = acc
+else:
+    _conv2d_nb = None
+
+def _cuda_device_available() -> bool:
+    """
+    Checks whether this OpenCV build was compiled with CUDA and can see a device.
+    :return: True if the cv2.cuda filters can be used, False otherwise.
+    """
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+
+_CUDA_AVAILABLE = _cuda_device_available()
+
 class ImageProcessor:
     """
     Class for kernel-based convolution and thresholding.
     """
 
+    # Opt-in: convolve custom kernels with numba instead of cv2.filter2D. filter2D
+    # is several times faster on one core and needs no JIT warm-up
+    USE_NUMBA_CONVOLUTION = False
+
+    # numba only: custom kernels that are exact multiples of 1/256 stay on OpenCV's 8-bit filter path
+    KERNEL_QUANTIZATION_SCALE = 256
+
+    # Images with at least this many pixels are convolved on the GPU when CUDA is available
+    CUDA_MIN_IMAGE_PIXELS = 1_000_000
+
+    # Generated kernels kept for reuse, matching the UI's preview cache
+    KERNEL_CACHE_SIZE = 32
+
     def __init__(self) -> None:
         """
         Initialize ImageProcessor with a given image file.
         :param image_path: Path to the image file to be processed.
         """
-        self.input_image_path = None
-        self.input_image_data = None
+        self.input_image_path: Optional[str] = None
+        self.input_image_data: Optional[np.ndarray] = None
 
         # ---------------------------
         #       IMAGE DATA
         # ---------------------------
         
-        self.__padded_image_data = None
-        self.__smoothed_image_data = None
+        self.__smoothed_image_data: Optional[np.ndarray] = None
+        self.__has_smoothed_image = False
+
+        self.__horizontal_edge_image_data: Optional[np.ndarray] = None
+        self.__vertical_edge_image_data: Optional[np.ndarray] = None
+        self.__edge_strength_image_data: Optional[np.ndarray] = None
 
-        self.__horizontal_edge_image_data = None
-        self.__vertical_edge_image_data = None
-        self.__edge_strength_image_data = None
+        # float32 scratch the numba convolution writes into
+        self.__convolution_image_data: Optional[np.ndarray] = None
 
         # ---------------------------
         #       KERNERL VAR
@@ -32,17 +99,15 @@ class ImageProcessor:
 
         self.available_smoothing_kernels = ["Gaussian", "Average", "Custom"]
         self.current_smoothing_kernel = None
+        self.current_separable_kernel: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self.current_kernel_spec: Optional[Tuple] = None
+
+        # (kernel type, size, sigma) -> (1D vector, 2D kernel), least recently used first
+        self.__kernel_cache: "OrderedDict[Tuple, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
 
-        self.__sobel_x = [
-            [-1, 0, 1],
-            [-2, 0, 2],
-            [-1, 0, 1]
-        ]
-        self.__sobel_y = [
-            [-1, -2, -1],
-            [0, 0, 0],
-            [1, 2, 1]
-        ]
+        # cv2.cuda filter for the current kernel, rebuilt on each update_kernel
+        self.__cuda_filter = None
+        self.__cuda_input_image = None
 
 
     # ---------------------------
@@ -52,9 +117,23 @@ class ImageProcessor:
     def get_available_kernels(self) -> List:
         return self.available_smoothing_kernels
 
-    def get_current_kernel(self) -> List:
+    def get_current_kernel(self) -> Optional[np.ndarray]:
         return self.current_smoothing_kernel
     
+    def get_kernel(self, kernel_type: str, **params) -> np.ndarray:
+        """
+        Returns a generated kernel without making it the current kernel.
+
+        :param kernel_type: "Gaussian" or "Average".
+        :param params: The size, and the sigma for Gaussian kernels.
+        :return: The read-only 2D kernel.
+        """
+        if kernel_type not in ("Gaussian", "Average"):
+            raise ValueError(f"Unsupported kernel type: {kernel_type}")
+
+        _, kernel = self.__get_cached_kernel(kernel_type, params.get("size"), params.get("sigma"))
+        return kernel
+
     def update_kernel(self, kernel_type: str, **params) -> None:
         """
         Updates the current kernel based on the selected type and parameters.
@@ -65,89 +144,261 @@ class ImageProcessor:
         if kernel_type == "Gaussian":
             size = params.get("size")
             sigma = params.get("sigma")
-            self.current_smoothing_kernel = self.__generate_gaussian_kernel(size, sigma)
+            vector, self.current_smoothing_kernel = self.__get_cached_kernel(kernel_type, size, sigma)
+            self.current_separable_kernel = (vector, vector)
+            self.current_kernel_spec = ("gaussian", size, sigma)
         elif kernel_type == "Average":
             size = params.get("size")
-            self.current_smoothing_kernel = self.__generate_average_kernel(size)
+            vector, self.current_smoothing_kernel = self.__get_cached_kernel(kernel_type, size)
+            self.current_separable_kernel = (vector, vector)
+            self.current_kernel_spec = ("box", size)
+        elif kernel_type == "Custom":
+            matrix = np.asarray(params.get("matrix"), dtype=np.float32)
+            if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1] or matrix.shape[0] % 2 == 0:
+                raise ValueError("Custom kernel must be a square matrix with an odd size.")
+            self.current_smoothing_kernel = matrix
+            self.current_separable_kernel = None
+            self.current_kernel_spec = ("custom",)
         else:
             self.current_smoothing_kernel = None
+            self.current_separable_kernel = None
+            self.current_kernel_spec = None
+            self.__cuda_filter = None
             raise ValueError(f"Unsupported kernel type: {kernel_type}")
 
-    def __generate_gaussian_kernel(self, size: int, sigma: float) -> List[List[float]]:
+        self.__cuda_filter = self.__create_cuda_filter() if _CUDA_AVAILABLE else None
+
+    def __create_cuda_filter(self):
+        """
+        Builds the cv2.cuda filter for the current kernel, so it is not rebuilt on every apply.
+
+        :return: A cv2.cuda.Filter, or None if the kernel cannot run on the GPU.
+        """
+        kernel = np.asarray(self.current_smoothing_kernel, dtype=np.float32)
+
+        # The GPU filter saturates to uint8, which would drop the absolute
+        # response that zero-sum kernels are kept as on the CPU
+        if self.__is_zero_sum_kernel(kernel):
+            return None
+
+        try:
+            if self.current_separable_kernel is not None:
+                kernel_x, kernel_y = self.current_separable_kernel
+                return cv2.cuda.createSeparableLinearFilter(cv2.CV_8UC1, cv2.CV_8UC1, kernel_x, kernel_y, rowBorderMode=cv2.BORDER_CONSTANT, columnBorderMode=cv2.BORDER_CONSTANT)
+
+            return cv2.cuda.createLinearFilter(cv2.CV_8UC1, cv2.CV_8UC1, kernel, borderMode=cv2.BORDER_CONSTANT)
+
+        except cv2.error as e:
+            # e.g. the kernel is larger than the CUDA filters support
+            print(f"CUDA filter unavailable, using CPU: {e}")
+            return None
+
+    def __get_cached_kernel(self, kernel_type: str, size: int, sigma: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Generates a 2D Gaussian kernel.
+        Returns the generated kernel for the given parameters, generating it only on first use.
+
+        The cached arrays are shared between calls, so they are made read-only.
+        The least recently used kernel is dropped once KERNEL_CACHE_SIZE are cached.
+        :param kernel_type: "Gaussian" or "Average".
+        :param size: The size of the kernel (size x size).
+        :param sigma: The standard deviation, only used by the Gaussian kernel.
+        :return: The 1D vector and the 2D kernel.
+        """
+        key = (kernel_type, size, sigma)
+        cached = self.__kernel_cache.get(key)
+        if cached is not None:
+            self.__kernel_cache.move_to_end(key)
+            return cached
+
+        if kernel_type == "Gaussian":
+            cached = self.__generate_gaussian_kernel(size, sigma)
+        else:
+            cached = self.__generate_average_kernel(size)
+
+        for array in cached:
+            array.flags.writeable = False
+
+        self.__kernel_cache[key] = cached
+        if len(self.__kernel_cache) > self.KERNEL_CACHE_SIZE:
+            self.__kernel_cache.popitem(last=False)
+        return cached
+
+    def __generate_gaussian_kernel(self, size: int, sigma: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Generates a 2D Gaussian kernel and the 1D vector it is separable into.
 
         :param size: The size of the kernel (size x size).
         :param sigma: The standard deviation of the Gaussian distribution.
-        :return: A 2D NumPy array representing the Gaussian kernel.
+        :return: The 1D Gaussian vector and the 2D Gaussian kernel, both summing to 1.
         """
         if size % 2 == 0:
             raise ValueError("Kernel size must be odd to ensure a center pixel.")
 
-        # Define the kernel grid (centered at 0)
+        # Define the 1D grid (centered at 0)
         k = size // 2
-        x, y = np.meshgrid(np.arange(-k, k + 1), np.arange(-k, k + 1))
+        x = np.arange(-k, k + 1, dtype=np.float32)
 
-        # Compute the Gaussian function
-        gaussian_kernel = np.exp(-(x**2 + y**2) / (2 * sigma**2))
-        
-        # Normalize the kernel so that the sum equals 1
-        gaussian_kernel /= np.sum(gaussian_kernel)
+        # Compute the Gaussian function along one axis only
+        gaussian_vector = np.exp(-(x * x) / (2 * sigma * sigma))
 
-        return np.ndarray.tolist(gaussian_kernel)
+        # Normalize the vector so that the sum equals 1
+        gaussian_vector /= np.sum(gaussian_vector)
+
+        # The 2D kernel is the outer product, which also sums to 1
+        gaussian_kernel = np.outer(gaussian_vector, gaussian_vector)
+
+        return gaussian_vector, gaussian_kernel
     
-    def __generate_average_kernel(self, size: int) -> List[List[float]]:
+    def __generate_average_kernel(self, size: int) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Generates an averaging kernel of given size.
+        Generates an averaging kernel of given size and the 1D vector it is separable into.
 
         :param size: The size of the kernel (size x size).
-        :return: A 2D NumPy array representing the averaging kernel.
+        :return: The 1D averaging vector and the 2D averaging kernel, both summing to 1.
         """
         if size % 2 == 0:
             raise ValueError("Kernel size must be an odd integer to ensure a center pixel.")
 
-        # Create an NxN matrix filled with 1s
-        kernel = [[1] * size for _ in range (size)]
+        # Contiguous float32 buffers filled with 1 / N and 1 / (N * N)
+        average_vector = np.full(size, 1.0 / size, dtype=np.float32)
+        average_kernel = np.full((size, size), 1.0 / (size * size), dtype=np.float32)
 
-        # Normalize by dividing each element by the total number of elements
-        kernel /= (size * size)
+        return average_vector, average_kernel
+        
+    def __is_zero_sum_kernel(self, kernel: np.ndarray) -> bool:
+        """
+        Checks whether the kernel weights cancel out, as for edge and derivative kernels.
 
-        print(kernel)
+        The tolerance scales with the kernel, since float32 weights that should
+        cancel leave a remainder proportional to their magnitude.
+        :param kernel: 2D float32 kernel.
+        :return: True if the kernel sums to zero, False otherwise.
+        """
+        return bool(np.isclose(kernel.sum(), 0.0, atol=1e-5 * np.abs(kernel).sum()))
 
-        return np.ndarray.tolist(kernel)
-        
-    def __pad_image(self, kernel_size: int, image: List[List[int]]) -> List[List[int]]:
+    def __is_quantizable_kernel(self, kernel: np.ndarray) -> bool:
+        """
+        Checks whether every kernel value is an exact multiple of 1 / KERNEL_QUANTIZATION_SCALE,
+        as for integer emboss/sharpen kernels or binomial blurs such as 1/16 [1 2 1].
+
+        :param kernel: 2D float32 kernel.
+        :return: True if the kernel survives an int16 fixed-point round trip, False otherwise.
+        """
+        scaled = kernel * self.KERNEL_QUANTIZATION_SCALE
+        quantized = np.round(scaled)
+
+        if np.abs(quantized).max() > np.iinfo(np.int16).max:
+            return False
 
-        if not image or not image[0]:
-            raise ValueError("Input image cannot be empty")
+        return bool(np.allclose(scaled, quantized))
 
-        if kernel_size < 1 or kernel_size % 2 == 0:
-            raise ValueError("Kernel size must be a positive odd integer")
+    def apply_kernel(self) -> np.ndarray:
+        """
+        Applies the current smoothing kernel to the input image.
+
+        Large images go to the cached cv2.cuda filter when one is available.
+        Otherwise Gaussian and Average kernels use OpenCV's dedicated
+        cv2.GaussianBlur and cv2.boxFilter, and custom kernels use cv2.filter2D.
+        The numba convolution replaces filter2D only when USE_NUMBA_CONVOLUTION
+        is set. Pixels outside the image are treated as zero.
+        :return: Smoothed 2D uint8 array. This is the processor's reused output buffer,
+            overwritten by the next apply, so copy it to keep a result.
+        """
+        if self.input_image_data is None:
+            raise ValueError("No target image has been loaded")
 
-        img_height = len(image)
-        img_width = len(image[0])
-        pad_size = kernel_size // 2
+        if self.current_smoothing_kernel is None or self.current_kernel_spec is None:
+            raise ValueError("No kernel has been selected")
 
-        # create a padded zeroed array for the image
-        padded_image = [[0] * (img_width + 2 * pad_size) for _ in range(img_height + 2 * pad_size)]
+        image = self.input_image_data
+        kernel_name = self.current_kernel_spec[0]
 
-        # Copy the image over to the array
-        for row in range(img_height):
-            for col in range(img_width):
-                padded_image[row + pad_size][col + pad_size] = image[row][col]
+        if self.__cuda_filter is not None and image.size >= self.CUDA_MIN_IMAGE_PIXELS:
+            return self.__apply_kernel_cuda(image)
 
-        return padded_image
-    
+        if kernel_name == "gaussian":
+            _, size, sigma = self.current_kernel_spec
+            self.__smoothed_image_data = cv2.GaussianBlur(image, (size, size), sigma, dst=self.__smoothed_image_data, borderType=cv2.BORDER_CONSTANT)
+            self.__has_smoothed_image = True
+            return self.__smoothed_image_data
 
+        if kernel_name == "box":
+            _, size = self.current_kernel_spec
+            self.__smoothed_image_data = cv2.boxFilter(image, -1, (size, size), dst=self.__smoothed_image_data, borderType=cv2.BORDER_CONSTANT)
+            self.__has_smoothed_image = True
+            return self.__smoothed_image_data
 
+        kernel = np.asarray(self.current_smoothing_kernel, dtype=np.float32)
 
-    def __apply_kernel(self, kernel:List[List[int]]) -> List[List[int]]:
+        # Zero-sum (derivative-like) kernels respond negatively as often as
+        # positively, so their absolute response is kept instead of clipping at 0
+        is_zero_sum = self.__is_zero_sum_kernel(kernel)
+
+        use_numba = self.USE_NUMBA_CONVOLUTION and _conv2d_nb is not None
+
+        # numba only: without it every custom kernel already goes to filter2D.
+        # Kernels that are exact multiples of 1/256 are left to filter2D's 8-bit path
+        if use_numba and not self.__is_quantizable_kernel(kernel):
+            output = self.__convolution_image_data
+            _conv2d_nb(image, np.ascontiguousarray(kernel), output)
+        else:
+            if is_zero_sum:
+                response = cv2.filter2D(src=image, ddepth=cv2.CV_16S, kernel=kernel, borderType=cv2.BORDER_CONSTANT)
+                self.__smoothed_image_data = cv2.convertScaleAbs(response, dst=self.__smoothed_image_data)
+            else:
+                # OpenCV saturates to uint8 inside the filter, no float32 tail needed
+                self.__smoothed_image_data = cv2.filter2D(src=image, ddepth=cv2.CV_8U, kernel=kernel, dst=self.__smoothed_image_data, borderType=cv2.BORDER_CONSTANT)
+            self.__has_smoothed_image = True
+            return self.__smoothed_image_data
+
+        if is_zero_sum:
+            np.abs(output, out=output)
+
+        # Round like OpenCV's 8-bit filters, then clip and cast to uint8 in a single pass
+        np.rint(output, out=output)
+        np.clip(output, 0, 255, out=self.__smoothed_image_data, casting='unsafe')
+        self.__has_smoothed_image = True
+        return self.__smoothed_image_data
+
+    def __apply_kernel_cuda(self, image: np.ndarray) -> np.ndarray:
         """
-        Applies a convolutional kernel to the image.
-        :param kernel: Kernel 2D matrix.
-        :return: Processed 2D array.
+        Applies the cached cv2.cuda filter on the GPU.
+        :param image: 2D uint8 input image.
+        :return: Smoothed 2D uint8 array.
         """
-        return False
+        if self.__cuda_input_image is None:
+            self.__cuda_input_image = cv2.cuda_GpuMat()
+
+        # upload reuses the device buffer while the image size stays the same
+        self.__cuda_input_image.upload(image)
+        output = self.__cuda_filter.apply(self.__cuda_input_image)
+
+        self.__smoothed_image_data = output.download(self.__smoothed_image_data)
+        self.__has_smoothed_image = True
+        return self.__smoothed_image_data
+
+    def compute_edge_strength(self) -> np.ndarray:
+        """
+        Computes the edge strength of the smoothed image with 3x3 Sobel operators.
+
+        The horizontal and vertical gradients come from cv2.Sobel as int16, and
+        the strength is their per-pixel magnitude sqrt(gx^2 + gy^2).
+        :return: 2D float32 edge strength array. This is a reused buffer, overwritten
+            by the next call, so copy it to keep a result.
+        """
+        if not self.__has_smoothed_image:
+            raise ValueError("A kernel must be applied before computing edge strength")
+
+        smoothed = self.__smoothed_image_data
+
+        gradient_x = cv2.Sobel(smoothed, cv2.CV_16S, 1, 0, ksize=3)
+        gradient_y = cv2.Sobel(smoothed, cv2.CV_16S, 0, 1, ksize=3)
+
+        self.__horizontal_edge_image_data[...] = gradient_x
+        self.__vertical_edge_image_data[...] = gradient_y
+
+        self.__edge_strength_image_data = cv2.magnitude(self.__horizontal_edge_image_data, self.__vertical_edge_image_data, magnitude=self.__edge_strength_image_data)
+        return self.__edge_strength_image_data
 
     # ---------------------------
     #       IMAGE MANAGER
@@ -163,39 +414,83 @@ class ImageProcessor:
         try:
             self.input_image_data = self.__load_image_grayscale(file_path=file_path)
             self.input_image_path = file_path 
+            self.__allocate_image_buffers(self.input_image_data.shape)
+            self.__has_smoothed_image = False
             return True
         
         except Exception as e:
             print(f"Error loading image: {e}")
             return False
+
+    def __allocate_image_buffers(self, shape: Tuple[int, int]) -> None:
+        """
+        Allocates the contiguous output planes once per input image, so the
+        filtering passes can write into them instead of allocating per call.
+        Buffers are kept when the new image has the same size.
+        :param shape: (height, width) of the input image.
+        """
+        if self.__smoothed_image_data is not None and self.__smoothed_image_data.shape == shape:
+            return
+
+        self.__smoothed_image_data = np.empty(shape, dtype=np.uint8)
+        self.__convolution_image_data = np.empty(shape, dtype=np.float32)
+
+        self.__horizontal_edge_image_data = np.empty(shape, dtype=np.float32)
+        self.__vertical_edge_image_data = np.empty(shape, dtype=np.float32)
+        self.__edge_strength_image_data = np.empty(shape, dtype=np.float32)
         
+    def has_results(self) -> bool:
+        """
+        Checks whether a kernel has been applied to the current image, so there is something to save.
+        :return: True if a smoothed image is available, False otherwise.
+        """
+        return self.__has_smoothed_image
+
     def save_results(self, dir_path:str = '/') -> bool:
+        """
+        Saves the processed images into the given directory, named after the input image.
+
+        :param dir_path: Directory to write the result images into.
+        :return: True if the results are successfully saved, False otherwise.
+        """
         try:
-            # self._save_image(dir_path) TODO
+            if not self.__has_smoothed_image:
+                raise ValueError("No processed image to save")
+
+            base_name = os.path.splitext(os.path.basename(self.input_image_path))[0]
+            output_path = os.path.join(dir_path, f"{base_name}_smoothed.png")
+
+            if not self.__save_image(output_path, self.__smoothed_image_data):
+                raise IOError(f"Failed to write image: {output_path}")
+
             return True
         except Exception as e:
             print(f"Error saving results: {e}")
             return False
         
-    def __save_image(self, output_path: str, image_array: List[List[int]]) -> None:
+    def __save_image(self, output_path: str, image_array: np.ndarray) -> bool:
         """
         Saves an image to the specified file path.
         :param output_path: File path to save the image.
         :param image_array: 2D array to save.
+        :return: True if the image is successfully written, False otherwise.
         """
         return cv2.imwrite(output_path, image_array)
 
-    def __load_image_grayscale(self, file_path: str) -> List[List[int]]:
+    def __load_image_grayscale(self, file_path: str) -> np.ndarray:
         """
         Loads an image as a 2D array in grayscale.
+
+        The array decoded by cv2.imread is returned as-is, without copying.
         :param file_path: Path to the image file.
-        :return: 2D  array representing pixel intensities (0-255).
+        :return: 2D uint8 array representing pixel intensities (0-255).
         """
         image = cv2.imread(file_path, cv2.IMREAD_GRAYSCALE)
         
         if image is None:
             raise ValueError(f"Failed to load image: {file_path}")
         
-        return image.tolist()
+        # The numba kernels index rows directly and expect C-contiguous data
+        return np.ascontiguousarray(image)
 
     
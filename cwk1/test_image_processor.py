@@ -0,0 +1,146 @@
+"""
+test_image_processor.py
+
+Checks the CPU convolution branches of ImageProcessor.apply_kernel against cv2.filter2D,
+and compute_edge_strength against cv2.Sobel.
+"""
+import cv2
+import numpy as np
+import pytest
+
+from image_processor import ImageProcessor
+
+
+def _load_processor(tmp_path) -> ImageProcessor:
+    """
+    Returns an ImageProcessor with a random grayscale image loaded.
+    """
+    image = np.random.default_rng(0).integers(0, 256, size=(61, 83), dtype=np.uint8)
+    image_path = str(tmp_path / "noise.png")
+    cv2.imwrite(image_path, image)
+
+    processor = ImageProcessor()
+    assert processor.set_target_image(image_path)
+    return processor
+
+
+def _random_kernel(size: int) -> np.ndarray:
+    """
+    Returns a positive kernel summing to 1 that is not a multiple of 1/256.
+    """
+    kernel = np.random.default_rng(size).random((size, size)).astype(np.float32) + 0.1
+    return kernel / kernel.sum()
+
+
+def _zero_sum_kernel(size: int) -> np.ndarray:
+    """
+    Returns a kernel summing to 0 that is not a multiple of 1/256.
+    """
+    kernel = np.random.default_rng(size).random((size, size)).astype(np.float32)
+    return kernel - kernel.mean()
+
+
+def _assert_matches_filter2d(processor: ImageProcessor, kernel: np.ndarray) -> None:
+    """
+    The result may differ from filter2D by one grey level where the float sums
+    round differently, but must not be biased in either direction.
+    """
+    expected = cv2.filter2D(processor.input_image_data, cv2.CV_8U, kernel, borderType=cv2.BORDER_CONSTANT)
+    _assert_close(processor.apply_kernel(), expected)
+
+
+def _assert_matches_abs_filter2d(processor: ImageProcessor, kernel: np.ndarray) -> None:
+    """
+    Zero-sum kernels keep the absolute response, so compare with the absolute
+    value of filter2D's signed output.
+    """
+    response = cv2.filter2D(processor.input_image_data, cv2.CV_16S, kernel, borderType=cv2.BORDER_CONSTANT)
+    _assert_close(processor.apply_kernel(), cv2.convertScaleAbs(response))
+
+
+def _assert_close(result: np.ndarray, expected: np.ndarray) -> None:
+    diff = result.astype(np.int16) - expected
+
+    assert np.abs(diff).max() <= 1
+    assert abs(diff.mean()) < 0.05
+
+
+def test_custom_filter2d_matches_filter2d(tmp_path) -> None:
+    processor = _load_processor(tmp_path)
+    kernel = _random_kernel(5)
+    processor.update_kernel("Custom", matrix=kernel)
+
+    _assert_matches_filter2d(processor, kernel)
+
+
+def test_custom_numba_matches_filter2d(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("numba")
+    monkeypatch.setattr(ImageProcessor, "USE_NUMBA_CONVOLUTION", True)
+    processor = _load_processor(tmp_path)
+
+    for size in (3, 11):
+        kernel = _random_kernel(size)
+        processor.update_kernel("Custom", matrix=kernel)
+        _assert_matches_filter2d(processor, kernel)
+
+
+@pytest.mark.parametrize("kernel", [
+    np.array([[0, 1, 0], [1, -4, 1], [0, 1, 0]], dtype=np.float32),
+    _zero_sum_kernel(3),
+    _zero_sum_kernel(15),
+])
+def test_zero_sum_filter2d_keeps_absolute_response(tmp_path, kernel) -> None:
+    processor = _load_processor(tmp_path)
+    processor.update_kernel("Custom", matrix=kernel)
+
+    _assert_matches_abs_filter2d(processor, kernel)
+
+
+def test_zero_sum_numba_keeps_absolute_response(tmp_path, monkeypatch) -> None:
+    pytest.importorskip("numba")
+    monkeypatch.setattr(ImageProcessor, "USE_NUMBA_CONVOLUTION", True)
+    processor = _load_processor(tmp_path)
+
+    for size in (3, 11):
+        kernel = _zero_sum_kernel(size)
+        processor.update_kernel("Custom", matrix=kernel)
+        _assert_matches_abs_filter2d(processor, kernel)
+
+
+@pytest.mark.parametrize("kernel_type, params", [("Gaussian", {"size": 5, "sigma": 1.3}), ("Average", {"size": 3})])
+def test_generated_kernels_match_filter2d(tmp_path, kernel_type, params) -> None:
+    processor = _load_processor(tmp_path)
+    processor.update_kernel(kernel_type, **params)
+
+    _assert_matches_filter2d(processor, np.array(processor.get_current_kernel()))
+
+
+def test_edge_strength_matches_sobel_magnitude(tmp_path) -> None:
+    processor = _load_processor(tmp_path)
+    processor.update_kernel("Gaussian", size=5, sigma=1.3)
+    smoothed = processor.apply_kernel().copy()
+
+    gradient_x = cv2.Sobel(smoothed, cv2.CV_16S, 1, 0, ksize=3)
+    gradient_y = cv2.Sobel(smoothed, cv2.CV_16S, 0, 1, ksize=3)
+    expected = np.hypot(gradient_x.astype(np.float32), gradient_y.astype(np.float32))
+
+    np.testing.assert_allclose(processor.compute_edge_strength(), expected, rtol=1e-3, atol=1e-2)
+
+
+def test_edge_strength_requires_applied_kernel(tmp_path) -> None:
+    processor = _load_processor(tmp_path)
+    processor.update_kernel("Average", size=3)
+
+    with pytest.raises(ValueError, match="must be applied"):
+        processor.compute_edge_strength()
+
+
+def test_kernel_cache_drops_least_recently_used() -> None:
+    processor = ImageProcessor()
+    first = processor.get_kernel("Average", size=3)
+    assert processor.get_kernel("Average", size=3) is first
+
+    for size in range(5, 5 + 2 * ImageProcessor.KERNEL_CACHE_SIZE, 2):
+        processor.get_kernel("Average", size=size)
+
+    assert processor.get_kernel("Average", size=3) is not first
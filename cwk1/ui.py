@@ -5,31 +5,86 @@ Contains the Tkinter-based UI for displaying images and allowing user interactio
 """
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from typing import Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 from PIL import Image, ImageTk
 import numpy as np
 
 from image_processor import ImageProcessor
 
 
+# Decoded placeholder for the input image preview. Only the PIL image is shared,
+# each window builds its own PhotoImage since Tk images belong to one interpreter
+_DEFAULT_THUMB: Optional[Image.Image] = None
+
+
+def _get_default_thumb() -> Image.Image:
+    """
+    Returns the default input image preview, decoding default.png only once.
+    :return: The 50x50 placeholder preview image.
+    """
+    global _DEFAULT_THUMB
+    if _DEFAULT_THUMB is None:
+        _DEFAULT_THUMB = Image.open('./default.png').resize((50, 50), Image.BILINEAR)
+    return _DEFAULT_THUMB
+
+
 class MainApplication(tk.Tk):
     """
     Main Tkinter Application.
     """
+
+    # Delay before a kernel parameter edit refreshes the preview
+    PREVIEW_DEBOUNCE_MS = 150
+
+    # Number of kernel preview images kept for reuse
+    PREVIEW_CACHE_SIZE = 32
+
+    # Kernel sizes whose previews are rendered as soon as a kernel is selected
+    PREVIEW_WARM_SIZES = (3, 5, 7)
+
+    # Kernels generated from size and sigma alone, so their previews can be rendered ahead of time
+    WARMABLE_KERNELS = ("Gaussian", "Average")
+
+    # Largest side, in pixels, of a result image shown in the result panes
+    RESULT_PREVIEW_MAX_SIZE = 500
+
     def __init__(self) -> None:
         super().__init__()
+
+        # Hidden while the widgets are built, so Tk lays the window out once
+        self.withdraw()
         
         self.title("Cwk 1 Image Processor")
         # self.geometry("1500x1200")
         
         self.image_processor = ImageProcessor();
 
+        # The processor's kernel list is fixed, so read it once: the tuple for the dropdown, the set for lookups
+        self._available_kernels = tuple(self.image_processor.available_smoothing_kernels)
+        self._available_kernels_set = frozenset(self._available_kernels)
+
         # Kernel config
 
         self.selected_kernel = None
 
         self.image_path_var = tk.StringVar(value="")
 
+        # Pending after() job for the kernel preview, so rapid edits only rebuild once
+        self._preview_job: Optional[str] = None
+
+        # Decodes input image thumbnails off the Tk thread
+        self._thumb_pool = ThreadPoolExecutor(max_workers=1)
+
+        # Runs the image processing off the Tk thread, one job at a time
+        self._work_executor = ThreadPoolExecutor(max_workers=1)
+        # The apply_kernel call in flight, the processor's image and kernel must not change until it finishes
+        self._kernel_job: Optional[Future] = None
+
+        # (kernel, size, sigma) -> preview image, least recently used first
+        self._preview_cache: "OrderedDict[Tuple, bytes]" = OrderedDict()
+
         # --- Initialize UI Elements ---
         self._create_main_frames()
 
@@ -41,6 +96,8 @@ class MainApplication(tk.Tk):
 
         self._create_bottom_panel()
 
+        self.update_idletasks()
+        self.deiconify()
 
 
     def _create_main_frames(self) -> None:
@@ -54,7 +111,7 @@ class MainApplication(tk.Tk):
         self.top_container = tk.Frame(self)
         self.top_container.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
-         # Bottom frame: for saving
+        # Top frame: for selecting the input image
         self.top_frame = tk.Frame(self.top_container, bg="lightblue", height=50,  pady=5)
         self.top_frame.pack(side=tk.TOP, fill=tk.BOTH)
 
@@ -82,10 +139,13 @@ class MainApplication(tk.Tk):
         self.threshold_image_frame = tk.Frame(self.image_frame, bg="white", height=500)
         self.threshold_image_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
 
-        self.kernel_image_label = tk.Label(self.kernel_image_frame, text="Kernel Image Preview")
+        # Status text is set through variables, which skips Tk's option parsing on each update
+        self._kernel_label_var = tk.StringVar(value="Kernel Image Preview")
+        self.kernel_image_label = tk.Label(self.kernel_image_frame, textvariable=self._kernel_label_var)
         self.kernel_image_label.pack(pady=10)
 
-        self.threshold_image_label = tk.Label(self.threshold_image_frame, text="Threshold Image Preview")
+        self._threshold_label_var = tk.StringVar(value="Threshold Image Preview")
+        self.threshold_image_label = tk.Label(self.threshold_image_frame, textvariable=self._threshold_label_var)
         self.threshold_image_label.pack(pady=10)
 
     def _create_options_panes(self) -> None:
@@ -105,7 +165,7 @@ class MainApplication(tk.Tk):
         kernel_label.pack(pady=5)
 
         self.kernel_var = tk.StringVar()
-        self.kernel_dropdown = ttk.Combobox(self.kernel_options_frame, textvariable=self.kernel_var, values=self.image_processor.available_smoothing_kernels)
+        self.kernel_dropdown = ttk.Combobox(self.kernel_options_frame, textvariable=self.kernel_var, values=self._available_kernels)
         self.kernel_dropdown.set("Select kernel")
         self.kernel_dropdown.pack(side=tk.TOP, pady=5)
         self.kernel_dropdown.bind("<<ComboboxSelected>>", self.on_kernel_selected)
@@ -113,6 +173,22 @@ class MainApplication(tk.Tk):
         self.kernel_options_content_frame = tk.Frame(self.kernel_options_frame, bg="red")
         self.kernel_options_content_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
 
+        # Right-side panel, shared by every kernel
+        self.kernel_preview_canvas = tk.Canvas(self.kernel_options_content_frame, width=100, height=100, bg="white")
+        self.kernel_preview_canvas.pack(side=tk.RIGHT, padx=10, pady=10)
+
+        # One native Tk image for the lifetime of the window, its pixels are replaced on each update
+        self.kernel_preview_image = tk.PhotoImage(master=self, width=100, height=100)
+        self._preview_canvas_item = self.kernel_preview_canvas.create_image(50, 50, image=self.kernel_preview_image)
+
+        # Kernel name -> its options panel, built on first selection
+        self._kernel_option_widgets: Dict[str, tk.Frame] = {}
+        self._current_options_panel: Optional[tk.Frame] = None
+
+        # Shared by the options panels, so a kernel keeps its size when switching
+        self.kernel_size_var = tk.IntVar(value=3)
+        self.sigma_var = tk.DoubleVar(value=1.0)
+
         self.apply_kernel_button = tk.Button(self.kernel_options_frame, text="Apply Kernel", command=self.on_apply_kernel)
         self.apply_kernel_button.pack(side=tk.TOP)
 
@@ -120,8 +196,10 @@ class MainApplication(tk.Tk):
         threshold_label = tk.Label(self.threshold_options_frame, text="Threshold Options", bg="lightgreen")
         threshold_label.pack(pady=5)
 
-        self.threshold_value_var = tk.StringVar(value="128")
-        threshold_entry = tk.Entry(self.threshold_options_frame, textvariable=self.threshold_value_var)
+        self.threshold_value_var = tk.IntVar(value=128)
+        # Tk rejects non-digit keystrokes, so the value never needs parsing
+        validate_threshold = (self.register(self._validate_threshold_input), "%P")
+        threshold_entry = tk.Entry(self.threshold_options_frame, textvariable=self.threshold_value_var, validate="key", validatecommand=validate_threshold)
         threshold_entry.pack(pady=5)
 
         self.auto_threshold_var = tk.BooleanVar(value=False)
@@ -131,22 +209,6 @@ class MainApplication(tk.Tk):
         self.apply_threshold_button = tk.Button(self.threshold_options_frame, text="Apply Threshold", command=self.on_apply_threshold)
         self.apply_threshold_button.pack(pady=5)
 
-    def _create_bottom_panel(self) -> None:
-        """
-        Creates the bottom panel for selecting file path and saving.
-        """
-        tk.Label(self.bottom_frame, text="Save Path:", bg="lightblue").pack(side=tk.LEFT, padx=5)
-    
-        self.save_path_var = tk.StringVar()
-        self.save_path_entry = tk.Entry(self.bottom_frame, textvariable=self.save_path_var, width=50)
-        self.save_path_entry.pack(side=tk.LEFT, padx=5)
-
-        browse_button = tk.Button(self.bottom_frame, text="Browse...", command=self.on_browse_dir)
-        browse_button.pack(side=tk.LEFT, padx=5)
-
-        save_button = tk.Button(self.bottom_frame, text="Save Image", command=self.on_save_image)
-        save_button.pack(side=tk.LEFT, padx=5)
-
     def _create_top_panel(self) -> None:
         """
         Creates a top panel for selecting the target/input image to process.
@@ -160,15 +222,17 @@ class MainApplication(tk.Tk):
         self.image_path_entry.pack(side=tk.LEFT, padx=5)
 
         # Browse button
-        browse_button = tk.Button(self.top_text_entry_frame, text="Browse...", command=self.on_browse_input_image)
-        browse_button.pack(side=tk.LEFT, padx=5)
+        self.browse_image_button = tk.Button(self.top_text_entry_frame, text="Browse...", command=self.on_browse_input_image)
+        self.browse_image_button.pack(side=tk.LEFT, padx=5)
 
-         # Image Preview Label (Fixed Size)
-        image = Image.open('./default.png')  # Open image
-        image.thumbnail((50, 50))
-        place_holder= ImageTk.PhotoImage(image)
-        self.image_preview_label = tk.Label(self.top_text_entry_frame, bg="gray", width=50, height=50,image=place_holder)  # Placeholder
-        self.image_preview_label.pack(side=tk.LEFT, padx=25)
+        # Image Preview Canvas (Fixed Size), showing the placeholder until an image is chosen
+        self._placeholder_image = ImageTk.PhotoImage(_get_default_thumb(), master=self)
+        self.image_preview_canvas = tk.Canvas(self.top_text_entry_frame, width=50, height=50, bg="gray", highlightthickness=0)
+        self._preview_item = self.image_preview_canvas.create_image(0, 0, anchor=tk.NW, image=self._placeholder_image)
+        self.image_preview_canvas.pack(side=tk.LEFT, padx=25)
+
+        # Thumbnails are pasted into this one image rather than allocating a new one per file
+        self._preview_photo = ImageTk.PhotoImage(Image.new('RGB', (50, 50)), master=self)
 
         self.top_text_entry_frame.pack(side=tk.TOP)
 
@@ -187,61 +251,108 @@ class MainApplication(tk.Tk):
         browse_button = tk.Button(self.bottom_text_entry_frame, text="Browse...", command=self.on_browse_dir)
         browse_button.pack(side=tk.LEFT, padx=5)
 
-        save_button = tk.Button(self.bottom_text_entry_frame, text="Save Image", command=self.on_save_image)
-        save_button.pack(side=tk.LEFT, padx=5)
+        self.save_button = tk.Button(self.bottom_text_entry_frame, text="Save Image", command=self.on_save_image)
+        self.save_button.pack(side=tk.LEFT, padx=5)
 
         self.bottom_text_entry_frame.pack(side=tk.TOP)
 
     def _update_image_preview(self, file_path: str) -> None:
         """
-        Updates the image preview label with a resized version of the selected image.
+        Updates the image preview canvas with a resized version of the selected image.
+        The image is decoded on a worker thread so large files do not block the UI.
         :param file_path: Path to the image file.
         """
-        try:
-            image = Image.open(file_path)
-            image.thumbnail((50, 50)) 
+        future = self._thumb_pool.submit(self._decode_thumb, file_path)
+        # PhotoImage must be created on the Tk thread, so hand the result back to it
+        future.add_done_callback(lambda f: self.after(0, self._install_thumb, f))
 
-            # Convert to Tkinter image format
-            self.tk_image = ImageTk.PhotoImage(image)
+    @staticmethod
+    def _decode_thumb(file_path: str) -> Image.Image:
+        """
+        Decodes an image and shrinks it to fit the preview. Runs on the thumbnail pool.
+        :param file_path: Path to the image file.
+        :return: 50x50 RGB image, with the thumbnail centred on a gray background.
+        """
+        image = Image.open(file_path)
+        # Lets the JPEG decoder downscale while decoding, a no-op for other formats
+        image.draft('RGB', (50, 50))
+        image.thumbnail((50, 50), Image.BILINEAR)
+
+        # Letterbox to the fixed preview size so it can be pasted into the preview image
+        preview = Image.new('RGB', (50, 50), "gray")
+        preview.paste(image.convert('RGB'), ((50 - image.width) // 2, (50 - image.height) // 2))
+        return preview
 
-            # Set image in label
-            self.image_preview_label.config(image=self.tk_image)
-            self.image_preview_label.image = self.tk_image  # Keep reference to avoid garbage collection
+    def _install_thumb(self, future: Future) -> None:
+        """
+        Shows a decoded thumbnail in the image preview canvas.
+        :param future: The finished _decode_thumb call.
+        """
+        try:
+            image = future.result()
+
+            self._preview_photo.paste(image)
+            self.image_preview_canvas.itemconfig(self._preview_item, image=self._preview_photo)
 
         except Exception as e:
             print(f"Error loading preview: {e}")
 
     def _build_kernel_options(self) -> None:
         """
-        Builds and updates the kernel options panel based on the selected kernel type.
+        Shows the kernel options panel for the selected kernel type.
+        Each panel is built on first use and kept, later selections only swap which one is packed.
         """
-        for widget in self.kernel_options_content_frame.winfo_children():
-            widget.destroy()
+        if self._current_options_panel is not None:
+            self._current_options_panel.pack_forget()
+
+        options_panel = self._kernel_option_widgets.get(self.selected_kernel)
+        if options_panel is None:
+            options_panel = self._create_kernel_options_panel(self.selected_kernel)
+            self._kernel_option_widgets[self.selected_kernel] = options_panel
 
         # Left-side panel
-        options_panel = tk.Frame(self.kernel_options_content_frame, bg="lightyellow")
         options_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
+        self._current_options_panel = options_panel
 
-        # Right-side panel
-        self.kernel_preview_canvas = tk.Canvas(self.kernel_options_content_frame, width=100, height=100, bg="white")
-        self.kernel_preview_canvas.pack(side=tk.RIGHT, padx=10, pady=10)
+        self._update_kernel_preview()
 
-        tk.Label(options_panel, text="Kernel Size N:").pack(pady=2)
-        self.kernel_size_var = tk.IntVar(value=3)
-        tk.Entry(options_panel, textvariable=self.kernel_size_var, width=5).pack(pady=2)
+    def _create_kernel_options_panel(self, kernel_name: str) -> tk.Frame:
+        """
+        Creates the input fields for one kernel type.
+        :param kernel_name: The kernel the panel is for.
+        :return: The unpacked options panel.
+        """
+        options_panel = tk.Frame(self.kernel_options_content_frame, bg="lightyellow")
 
-        # Bind event to update kernel preview
-        self.kernel_size_var.trace_add("write", self._on_kernel_param_change)
+        tk.Label(options_panel, text="Kernel Size N:").pack(pady=2)
+        size_entry = tk.Entry(options_panel, textvariable=self.kernel_size_var, width=5)
+        size_entry.pack(pady=2)
+        self._bind_kernel_param_entry(size_entry)
 
-        if self.selected_kernel == "Gaussian":
+        if kernel_name == "Gaussian":
             tk.Label(options_panel, text="Sigma:").pack(pady=2)
-            self.sigma_var = tk.DoubleVar(value=1.0)
-            tk.Entry(options_panel, textvariable=self.sigma_var, width=5).pack(pady=2)
-            self.sigma_var.trace_add("write", self._on_kernel_param_change)
+            sigma_entry = tk.Entry(options_panel, textvariable=self.sigma_var, width=5)
+            sigma_entry.pack(pady=2)
+            self._bind_kernel_param_entry(sigma_entry)
 
-        self.kernel_options_content_frame.update_idletasks()
-        self._update_kernel_preview()
+        return options_panel
+
+    def _bind_kernel_param_entry(self, entry: tk.Entry) -> None:
+        """
+        Updates the kernel preview once the user finishes editing an entry, rather than on every keystroke.
+        :param entry: A kernel parameter entry.
+        """
+        entry.bind("<FocusOut>", self._on_kernel_param_change)
+        entry.bind("<Return>", self._on_kernel_param_change)
 
+    @staticmethod
+    def _validate_threshold_input(proposed: str) -> bool:
+        """
+        Entry validatecommand for the threshold field.
+        :param proposed: The entry text if the edit is allowed.
+        :return: True for digits or an empty field, False otherwise.
+        """
+        return proposed.isdigit() or proposed == ""
 
     # ---------------------------
     #       EVENT HANDLERS
@@ -252,65 +363,165 @@ class MainApplication(tk.Tk):
         Called when the user selects a kernel from the dropdown.
         """
         selected_name = self.kernel_var.get()
-        if selected_name in self.image_processor.available_smoothing_kernels:
+        if selected_name == self.selected_kernel:
+            return
+
+        if selected_name in self._available_kernels_set:
             self.selected_kernel = selected_name
-            self._build_kernel_options() 
+            self._build_kernel_options()
+
+            if selected_name in self.WARMABLE_KERNELS:
+                self.after_idle(self._warm_cache, selected_name) 
 
     def _on_kernel_param_change(self, *args) -> None:
         """
         Called whenever a kernel-related input field is modified.
-        It updates the kernel and refreshes the preview.
+        Schedules a kernel and preview refresh, cancelling any refresh still pending.
         """
-        
-        kernel_size = self.kernel_size_var.get()
-        if not kernel_size:
-            kernel_size = 0
-        params = {"size": kernel_size}
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+        self._preview_job = self.after(self.PREVIEW_DEBOUNCE_MS, self._do_preview_update)
 
-        if self.selected_kernel == "Gaussian":
-            params["sigma"] = self.sigma_var.get()
+    def _do_preview_update(self) -> bool:
+        """
+        Updates the kernel from the current input fields and refreshes the preview.
+        :return: True if the kernel now matches the input fields, False if they could not be read
+            or a kernel is still being applied.
+        """
+        self._preview_job = None
+
+        # update_kernel would swap the kernel under the running apply, so retry once it is done
+        if self._kernel_job is not None:
+            self._on_kernel_param_change()
+            return False
+
+        try:
+            kernel_size = self.kernel_size_var.get()
+            params = {"size": kernel_size}
+
+            if self.selected_kernel == "Gaussian":
+                params["sigma"] = self.sigma_var.get()
+        except tk.TclError:
+            # The entry is mid-edit (empty or a partial number)
+            return False
 
         self.image_processor.update_kernel(self.selected_kernel, **params)
 
-        self._update_kernel_preview()
+        cache_key = self._preview_cache_key(self.selected_kernel, params["size"], params.get("sigma"))
+        self._update_kernel_preview(cache_key)
+        return True
 
-    def _update_kernel_preview(self) -> None:
+    def _update_kernel_preview(self, cache_key: Optional[Tuple] = None) -> None:
         """
         Retrieves the kernel matrix from the ImageProcessor, converts it into an image,
         and displays it in the kernel preview canvas. Catches errors and displays them to the user.
+        :param cache_key: Key from _preview_cache_key for the current kernel. When given,
+            the preview image is reused for repeat parameters instead of being rebuilt.
         """
         try:
             if not self.selected_kernel:
                 return
 
+            if cache_key is not None and cache_key in self._preview_cache:
+                self._preview_cache.move_to_end(cache_key)
+                self._show_kernel_preview(self._preview_cache[cache_key])
+                return
+
             # Get the kernel matrix (2D list) from the ImageProcessor
             kernel_matrix = self.image_processor.get_current_kernel()
 
             if kernel_matrix is None or len(kernel_matrix) == 0:
                 return
 
-            kernel_array = np.array(kernel_matrix)
-
-            # Normalize values for better visualization
-            kernel_min, kernel_max = kernel_array.min(), kernel_array.max()
-            if kernel_max > kernel_min:  # Avoid division by zero
-                kernel_array = (kernel_array - kernel_min) / (kernel_max - kernel_min) * 255
-
-            # Convert to PIL Image
-            kernel_image = Image.fromarray(kernel_array.astype("uint8"))
-            kernel_image = kernel_image.resize((100, 100), Image.NEAREST)
+            preview_image = self._render_kernel_preview(kernel_matrix)
 
-            # Convert to Tkinter-compatible image
-            self.kernel_preview_image = ImageTk.PhotoImage(kernel_image)
+            if cache_key is not None:
+                self._cache_kernel_preview(cache_key, preview_image)
 
-            # Display in the canvas
-            self.kernel_preview_canvas.create_image(50, 50, image=self.kernel_preview_image)
-            self.kernel_preview_canvas.image = self.kernel_preview_image  # Prevent garbage collection
+            self._show_kernel_preview(preview_image)
 
         except Exception as e:
             # Show error message popup
             messagebox.showerror("Kernel Preview Error", f"An error occurred while updating the kernel preview:\n{e}")
 
+    def _render_kernel_preview(self, kernel_matrix: np.ndarray) -> bytes:
+        """
+        Converts a kernel matrix into a 100x100 grayscale preview image.
+        :param kernel_matrix: 2D kernel to visualise.
+        :return: The preview as binary PGM data, normalised so the smallest value is black and the largest white.
+        """
+        # Copy, the processor's cached kernels are read-only
+        kernel_array = np.array(kernel_matrix, dtype=np.float32)
+
+        # Normalize values in place for better visualization
+        kernel_min, kernel_max = float(kernel_array.min()), float(kernel_array.max())
+        if kernel_max > kernel_min:  # Avoid division by zero
+            np.subtract(kernel_array, kernel_min, out=kernel_array)
+            np.multiply(kernel_array, np.float32(255.0 / (kernel_max - kernel_min)), out=kernel_array)
+
+        # Clip and cast to uint8 in a single pass
+        kernel_pixels = np.empty(kernel_array.shape, dtype=np.uint8)
+        np.clip(kernel_array, 0, 255, out=kernel_pixels, casting='unsafe')
+
+        size = kernel_pixels.shape[0]
+        if size < 100:
+            # Scale up by whole-pixel replication, then stretch the edge to fill 100x100
+            scale = 100 // size
+            kernel_pixels = np.repeat(np.repeat(kernel_pixels, scale, axis=0), scale, axis=1)
+            pad = 100 - kernel_pixels.shape[0]
+            if pad:
+                kernel_pixels = np.pad(kernel_pixels, ((0, pad), (0, pad)), mode='edge')
+        elif size > 100:
+            kernel_pixels = kernel_pixels[:100, :100]
+
+        # Tk reads binary PGM natively, so the preview never goes through PIL
+        return b"P5 100 100 255\n" + kernel_pixels.tobytes()
+
+    def _cache_kernel_preview(self, cache_key: Tuple, preview_image: bytes) -> None:
+        """
+        Stores a preview image, dropping the least recently used one when the cache is full.
+        :param cache_key: Key from _preview_cache_key.
+        :param preview_image: The preview image to store.
+        """
+        self._preview_cache[cache_key] = preview_image
+        if len(self._preview_cache) > self.PREVIEW_CACHE_SIZE:
+            self._preview_cache.popitem(last=False)
+
+    @staticmethod
+    def _preview_cache_key(kernel_name: str, size: int, sigma: Optional[float] = None) -> Tuple:
+        """
+        Builds the preview cache key for a kernel. Sigma is rounded to 0.1, which is
+        finer than the 100x100 preview can show, so nearby values share an image.
+        :param kernel_name: The kernel type.
+        :param size: The kernel size.
+        :param sigma: The Gaussian sigma, None for other kernels.
+        :return: (kernel, size, rounded sigma).
+        """
+        return (kernel_name, size, None if sigma is None else round(sigma, 1))
+
+    def _warm_cache(self, kernel_name: str) -> None:
+        """
+        Renders the previews for the common kernel sizes with the default sigma,
+        so the first edits after selecting a kernel hit the cache.
+        :param kernel_name: The kernel type to render previews for.
+        """
+        sigma = 1.0 if kernel_name == "Gaussian" else None
+        for size in self.PREVIEW_WARM_SIZES:
+            cache_key = self._preview_cache_key(kernel_name, size, sigma)
+            if cache_key in self._preview_cache:
+                continue
+
+            kernel_matrix = self.image_processor.get_kernel(kernel_name, size=size, sigma=sigma)
+            self._cache_kernel_preview(cache_key, self._render_kernel_preview(kernel_matrix))
+
+    def _show_kernel_preview(self, preview_image: bytes) -> None:
+        """
+        Displays a kernel preview image in the kernel preview canvas.
+        :param preview_image: The 100x100 preview as binary PGM data.
+        """
+        # Loads into the canvas' existing Tk image instead of allocating a new one per update
+        self.kernel_preview_image.configure(data=preview_image, format="PPM")
+
     def on_apply_kernel(self) -> None:
         """
         Applies the selected kernel to the original image data.
@@ -319,25 +530,80 @@ class MainApplication(tk.Tk):
             messagebox.showwarning("No Kernel Selected", "Please select a kernel first.")
             return
 
-        # Apply kernel
-        # self.kernel_image_data = apply_kernel(self.original_image_data, self.selected_kernel)
-        # Update UI (placeholder text)
-        self.kernel_image_label.config(text=f"Kernel: {self.selected_kernel} applied")
+        # Bring the kernel in line with the entries, including an edit still waiting on the debounce
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+        try:
+            kernel_updated = self._do_preview_update()
+        except ValueError as e:
+            messagebox.showerror("Invalid Kernel", str(e))
+            return
+
+        if not kernel_updated:
+            # Applying now would use the previous kernel under the new label
+            messagebox.showwarning("Invalid Value", "Kernel size and sigma must be numbers.")
+            return
+
+        # Convolve on the worker thread, OpenCV and numba release the GIL so Tk stays responsive
+        self._set_processing_controls_state(tk.DISABLED)
+        kernel_name = self.selected_kernel
+        self._kernel_label_var.set(f"Kernel: applying {kernel_name}...")
+        self._kernel_job = self._work_executor.submit(self.image_processor.apply_kernel)
+        self._kernel_job.add_done_callback(lambda f: self.after(0, self._on_kernel_done, f, kernel_name))
+
+    def _set_processing_controls_state(self, state: str) -> None:
+        """
+        Enables or disables the buttons that would change or read the processor's
+        image buffers, which the worker thread uses while a kernel is being applied.
+        :param state: tk.NORMAL or tk.DISABLED.
+        """
+        for button in (self.apply_kernel_button, self.browse_image_button, self.save_button):
+            button.config(state=state)
+
+    def _on_kernel_done(self, future: Future, kernel_name: str) -> None:
+        """
+        Shows the result of an apply_kernel call once the worker thread finishes.
+        :param future: The finished apply_kernel call.
+        :param kernel_name: The kernel that was applied, the dropdown may have changed since.
+        """
+        self._kernel_job = None
+        self._set_processing_controls_state(tk.NORMAL)
+
+        try:
+            smoothed = future.result()
+        except Exception as e:
+            self._kernel_label_var.set("Kernel Image Preview")
+            messagebox.showerror("Apply Kernel Error", f"An error occurred while applying the kernel:\n{e}")
+            return
+
+        height, width = smoothed.shape
+        result_image = tk.PhotoImage(master=self, data=f"P5 {width} {height} 255\n".encode() + smoothed.tobytes(), format="PPM")
+
+        # Shrink large results by a whole factor so they fit the result pane.
+        # subsample creates its copy on result_image's interpreter, so it stays on this window
+        factor = -(-max(height, width) // self.RESULT_PREVIEW_MAX_SIZE)
+        if factor > 1:
+            result_image = result_image.subsample(factor)
+
+        self._kernel_result_image = result_image  # Keep reference to avoid garbage collection
+        self.kernel_image_label.config(image=self._kernel_result_image, compound=tk.TOP)
+        self._kernel_label_var.set(f"Kernel: {kernel_name} applied")
 
     def on_apply_threshold(self) -> None:
         """
         Applies thresholding to the kernel image data (or original).
         """
         try:
-            threshold_val = int(self.threshold_value_var.get())
-        except ValueError:
+            threshold_val = self.threshold_value_var.get()
+        except tk.TclError:
+            # The only input the entry accepts that is not an integer is an empty field
             messagebox.showwarning("Invalid Value", "Threshold value must be an integer.")
             return
 
         use_auto = self.auto_threshold_var.get()
         # Apply threshold
         # self.threshold_image_data = apply_threshold(self.kernel_image_data, threshold_val, use_auto=use_auto)
-        self.threshold_image_label.config(text=f"Threshold applied (val={threshold_val}, auto={use_auto})")
+        self._threshold_label_var.set(f"Threshold applied (val={threshold_val}, auto={use_auto})")
 
     def on_browse_dir(self) -> None:
         """
@@ -366,15 +632,19 @@ class MainApplication(tk.Tk):
 
     def on_save_image(self) -> None:
         """
-        Save the processed image to the specified path (placeholder).
+        Save the processed image to the specified path.
         """
         save_path = self.save_path_var.get()
         if not save_path:
             messagebox.showwarning("No Path", "Please specify a path to save the image.")
             return
 
-        if ImageProcessor.save_results(self, dir_path=save_path):
-            messagebox.showinfo("Save Image", f"Image saved (pretend) to: {save_path}")
+        if not self.image_processor.has_results():
+            messagebox.showwarning("No Image", "Please apply a kernel before saving.")
+            return
+
+        if self.image_processor.save_results(dir_path=save_path):
+            messagebox.showinfo("Save Image", f"Image saved to: {save_path}")
         else:
             messagebox.showerror("Error", "Error When Saving Results. Check File Path.")
         return